@@ -0,0 +1,297 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from response_models import UserStoryEvalResponse
+
+DEFAULT_STORE_PATH = ".tpm-agent/evaluations.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    repository TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    evaluated_at TEXT NOT NULL,
+    summary TEXT,
+    title_complete INTEGER,
+    description_complete INTEGER,
+    acceptance_criteria_complete INTEGER,
+    importance TEXT,
+    acceptance_criteria_evaluation TEXT,
+    suggested_labels TEXT,
+    issue_labels TEXT,
+    ready_to_work INTEGER,
+    base_story_not_clear INTEGER,
+    refactored TEXT,
+    duration_ms REAL,
+    prompt_tokens INTEGER,
+    completion_tokens INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_evaluations_issue
+    ON evaluations (repository, issue_number, id);
+"""
+
+EXPORT_COLUMNS = [
+    "id",
+    "repository",
+    "issue_number",
+    "content_hash",
+    "evaluated_at",
+    "summary",
+    "title_complete",
+    "description_complete",
+    "acceptance_criteria_complete",
+    "importance",
+    "acceptance_criteria_evaluation",
+    "suggested_labels",
+    "issue_labels",
+    "ready_to_work",
+    "base_story_not_clear",
+    "refactored",
+    "duration_ms",
+    "prompt_tokens",
+    "completion_tokens",
+]
+
+
+def compute_content_hash(title: str, body: str) -> str:
+    """
+    Compute a stable hash of an issue's title and body.
+
+    Args:
+        title (str): The issue title.
+        body (str): The issue body.
+
+    Returns:
+        str: Hex-encoded SHA-256 digest of the issue content.
+    """
+    digest = hashlib.sha256()
+    digest.update((title or "").encode("utf-8"))
+    digest.update(b"\0")
+    digest.update((body or "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+class EvaluationStore:
+    """
+    Local SQLite store of evaluation results for analytics and the /apply path.
+    """
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def record(
+        self,
+        repository: str,
+        issue_number: int,
+        content_hash: str,
+        evaluation: UserStoryEvalResponse,
+        issue_labels: Optional[List[str]] = None,
+        duration_ms: float = 0.0,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+    ) -> int:
+        """
+        Persist an evaluation result.
+
+        Args:
+            repository (str): Repository in 'owner/name' format.
+            issue_number (int): The issue number.
+            content_hash (str): Hash of the issue content that was evaluated.
+            evaluation (UserStoryEvalResponse): The parsed evaluation.
+            issue_labels (List[str], optional): Labels on the issue at evaluation time.
+            duration_ms (float): Wall-clock time spent on the completion.
+            prompt_tokens (int): Prompt tokens reported by the service.
+            completion_tokens (int): Completion tokens reported by the service.
+
+        Returns:
+            int: The row id of the stored evaluation.
+        """
+        data = evaluation.to_dict()
+        with self.connection:
+            cursor = self.connection.execute(
+                """
+                INSERT INTO evaluations (
+                    repository, issue_number, content_hash, evaluated_at, summary,
+                    title_complete, description_complete, acceptance_criteria_complete,
+                    importance, acceptance_criteria_evaluation, suggested_labels, issue_labels,
+                    ready_to_work, base_story_not_clear, refactored,
+                    duration_ms, prompt_tokens, completion_tokens
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    repository,
+                    issue_number,
+                    content_hash,
+                    datetime.now(timezone.utc).isoformat(),
+                    data["summary"],
+                    int(data["title_complete"]),
+                    int(data["description_complete"]),
+                    int(data["acceptance_criteria_complete"]),
+                    data["importance"],
+                    data["acceptance_criteria_evaluation"],
+                    json.dumps(data["labels"]),
+                    json.dumps(issue_labels or []),
+                    int(data["ready_to_work"]),
+                    int(data["base_story_not_clear"]),
+                    json.dumps(data["refactored"]),
+                    duration_ms,
+                    prompt_tokens,
+                    completion_tokens,
+                ),
+            )
+        return cursor.lastrowid
+
+    def latest(
+        self, repository: str, issue_number: int, content_hash: Optional[str] = None
+    ) -> Optional[UserStoryEvalResponse]:
+        """
+        Return the most recent evaluation for an issue.
+
+        Args:
+            repository (str): Repository in 'owner/name' format.
+            issue_number (int): The issue number.
+            content_hash (str, optional): If given, only match evaluations of this exact content.
+
+        Returns:
+            UserStoryEvalResponse: The stored evaluation, or None if not found.
+        """
+        query = "SELECT * FROM evaluations WHERE repository = ? AND issue_number = ?"
+        params = [repository, issue_number]
+        if content_hash is not None:
+            query += " AND content_hash = ?"
+            params.append(content_hash)
+        row = self.connection.execute(query + " ORDER BY id DESC LIMIT 1", params).fetchone()
+        if row is None:
+            return None
+        return UserStoryEvalResponse.from_dict({
+            "summary": row["summary"],
+            "title_complete": row["title_complete"],
+            "description_complete": row["description_complete"],
+            "acceptance_criteria_complete": row["acceptance_criteria_complete"],
+            "importance": row["importance"],
+            "acceptance_criteria_evaluation": row["acceptance_criteria_evaluation"],
+            "labels": json.loads(row["suggested_labels"] or "[]"),
+            "ready_to_work": row["ready_to_work"],
+            "base_story_not_clear": row["base_story_not_clear"],
+            "refactored": json.loads(row["refactored"] or "{}"),
+        })
+
+    def readiness_summary(self, repository: Optional[str] = None) -> Dict[str, int]:
+        """
+        Summarize readiness across the latest evaluation of each issue.
+
+        Args:
+            repository (str, optional): Restrict the summary to one repository.
+
+        Returns:
+            dict: Counts of evaluated, ready, needs-refactor and unclear issues,
+                plus total tokens spent across all stored evaluations.
+        """
+        where = "WHERE repository = ?" if repository else ""
+        params = [repository] if repository else []
+        row = self.connection.execute(
+            f"""
+            SELECT
+                COUNT(*) AS evaluated,
+                COALESCE(SUM(ready_to_work), 0) AS ready,
+                COALESCE(SUM(base_story_not_clear), 0) AS unclear,
+                COALESCE(SUM(CASE WHEN ready_to_work = 0 AND base_story_not_clear = 0 THEN 1 ELSE 0 END), 0) AS needs_refactor
+            FROM evaluations
+            WHERE id IN (
+                SELECT MAX(id) FROM evaluations {where} GROUP BY repository, issue_number
+            )
+            """,
+            params,
+        ).fetchone()
+        tokens = self.connection.execute(
+            f"SELECT COALESCE(SUM(prompt_tokens + completion_tokens), 0) FROM evaluations {where}",
+            params,
+        ).fetchone()[0]
+        return {
+            "evaluated": row["evaluated"],
+            "ready": row["ready"],
+            "needs_refactor": row["needs_refactor"],
+            "unclear": row["unclear"],
+            "total_tokens": tokens,
+        }
+
+    def export(self, out, fmt: str = "csv", repository: Optional[str] = None) -> int:
+        """
+        Export stored evaluations to a file-like object.
+
+        Args:
+            out: Writable text stream.
+            fmt (str): 'csv' or 'jsonl'.
+            repository (str, optional): Restrict the export to one repository.
+
+        Returns:
+            int: Number of rows exported.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        if fmt not in ("csv", "jsonl"):
+            raise ValueError(f"Unsupported export format: {fmt}")
+        query = f"SELECT {', '.join(EXPORT_COLUMNS)} FROM evaluations"
+        params = []
+        if repository:
+            query += " WHERE repository = ?"
+            params.append(repository)
+        cursor = self.connection.execute(query + " ORDER BY id", params)
+        writer = csv.writer(out) if fmt == "csv" else None
+        if writer:
+            writer.writerow(EXPORT_COLUMNS)
+        count = 0
+        for row in cursor:
+            if writer:
+                writer.writerow(list(row))
+            else:
+                out.write(json.dumps(dict(row)) + "\n")
+            count += 1
+        return count
+
+
+def main() -> None:
+    """Command-line entry point for querying and exporting the evaluation store."""
+    parser = argparse.ArgumentParser(description="Query the local TPM Agent evaluation store.")
+    parser.add_argument("--path", default=DEFAULT_STORE_PATH, help="Path to the SQLite store.")
+    parser.add_argument("--repository", default=None, help="Restrict to one 'owner/name' repository.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("summary", help="Print readiness counts for the latest evaluation of each issue.")
+    export_parser = subparsers.add_parser("export", help="Export all stored evaluations.")
+    export_parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"Error: Evaluation store not found: {args.path}", file=sys.stderr)
+        sys.exit(1)
+
+    store = EvaluationStore(args.path)
+    try:
+        if args.command == "summary":
+            for key, value in store.readiness_summary(args.repository).items():
+                print(f"{key}: {value}")
+        else:
+            store.export(sys.stdout, fmt=args.format, repository=args.repository)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
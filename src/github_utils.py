@@ -1,23 +1,135 @@
+from datetime import datetime
 from enum import Enum
-from github import Github
+from typing import Dict, Iterator, List, Optional, Tuple
 from github.Issue import Issue
+from github.PaginatedList import PaginatedList
+from github.Repository import Repository
+import queue
+import re
 import sys
+import threading
+import time
+
+from transport import get_github_client, get_transport_config
+
+AI_ENHANCED_MARKER = "AI-enhanced Evaluation"
+DEFAULT_LABEL_CACHE_TTL = 300.0
+PREFETCH_PAGES = 1
 
 class GithubEvent(Enum):
     ISSUE = "issues"
     ISSUE_COMMENT = "issue_comment"
+    SCHEDULE = "schedule"
+    WORKFLOW_DISPATCH = "workflow_dispatch"
 
 class GithubLabel(Enum):
     VSWE_ASSIGN = "vswe-assign"
     VTPM_REVIEW = "vtpm-review"
     VTPM_IGNORE = "vtpm-ignore"
 
-def has_label(issue: Issue, label_name: str) -> bool:
+class IssueRecord:
+    """
+    Compact snapshot of the issue fields the agent uses, in place of a full PyGithub Issue.
+    """
+    __slots__ = ("number", "title", "body", "labels", "updated_at", "comments")
+
+    def __init__(self, number: int, title: str, body: str, labels: List[str], updated_at=None, comments: int = 0):
+        self.number = number
+        self.title = title
+        self.body = body
+        self.labels = labels
+        self.updated_at = updated_at
+        self.comments = comments
+
+    @classmethod
+    def from_issue(cls, issue: Issue):
+        return cls(
+            number=issue.number,
+            title=issue.title,
+            body=issue.body or "",
+            labels=[label.name for label in issue.labels],
+            updated_at=issue.updated_at,
+            comments=issue.comments,
+        )
+
+
+class CommentRecord:
+    """
+    Compact snapshot of an issue comment's id and body.
+    """
+    __slots__ = ("id", "body")
+
+    def __init__(self, id: int, body: str):
+        self.id = id
+        self.body = body
+
+    @classmethod
+    def from_comment(cls, comment):
+        return cls(id=comment.id, body=comment.body or "")
+
+
+def iter_pages(paginated: PaginatedList, prefetch_pages: int = PREFETCH_PAGES) -> Iterator:
+    """
+    Stream the elements of a paginated GitHub listing one page at a time.
+
+    Unlike iterating a PaginatedList directly, which caches every element it has
+    fetched, this holds only the page being consumed plus a bounded buffer of
+    pages fetched ahead in a background thread. Listing stops at the first short
+    page, so no trailing empty page is requested. When the consumer stops early,
+    the generator waits for an in-flight fetch to finish before returning.
+
+    Args:
+        paginated (PaginatedList): The PyGithub paginated listing.
+        prefetch_pages (int): Pages fetched ahead of the consumer. Defaults to 1.
+
+    Yields:
+        The raw PyGithub objects, in listing order.
+    """
+    page_size = get_transport_config().page_size
+    buffer: queue.Queue = queue.Queue(maxsize=max(prefetch_pages, 1))
+    stop = threading.Event()
+
+    def put(item) -> None:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def fetch() -> None:
+        page_number = 0
+        try:
+            while not stop.is_set():
+                page = paginated.get_page(page_number)
+                put(page)
+                if len(page) < page_size:
+                    return
+                page_number += 1
+        except Exception as e:
+            put(e)
+
+    producer = threading.Thread(target=fetch, daemon=True)
+    producer.start()
+    try:
+        while True:
+            page = buffer.get()
+            if isinstance(page, Exception):
+                raise page
+            yield from page
+            if len(page) < page_size:
+                return
+    finally:
+        # Wait for any in-flight fetch so the shared GitHub session is never used concurrently
+        stop.set()
+        producer.join()
+
+def has_label(issue, label_name: str) -> bool:
     """
     Check if a GitHub issue has a label with the given name (case-insensitive).
 
     Args:
-        issue (Issue.Issue): The GitHub issue object.
+        issue (Issue.Issue | IssueRecord): The GitHub issue object or record.
         label_name (str): The label name to check for.
 
     Returns:
@@ -25,7 +137,101 @@ def has_label(issue: Issue, label_name: str) -> bool:
     """
     if not hasattr(issue, "labels") or not isinstance(issue.labels, list):
         return False
-    return any(getattr(label, "name", "").lower() == label_name.lower() for label in issue.labels)
+    wanted = label_name.casefold()
+    return any(
+        (label if isinstance(label, str) else getattr(label, "name", "")).casefold() == wanted
+        for label in issue.labels
+    )
+
+RESERVED_LABELS = {label.value.casefold() for label in GithubLabel}
+
+def _label_key(name: str) -> str:
+    key = re.sub(r"\s*([:/])\s*", r"\1", name.strip().casefold())
+    return re.sub(r"[\s_-]+", "-", key)
+
+def _singular_key(key: str) -> str:
+    if len(key) > 3 and key.endswith("s") and not key.endswith("ss"):
+        return key[:-1]
+    return key
+
+class LabelIndex:
+    """
+    Case-folded lookup over the labels that exist in a repository, tolerant of
+    separator and plural variants. The agent's own control labels are excluded.
+    """
+    def __init__(self, names: List[str]):
+        self.names = [name for name in names if name.casefold() not in RESERVED_LABELS]
+        self._by_key: Dict[str, str] = {}
+        for name in self.names:
+            self._by_key.setdefault(name.casefold(), name)
+        for name in self.names:
+            self._by_key.setdefault(_label_key(name), name)
+        for name in self.names:
+            self._by_key.setdefault(_singular_key(_label_key(name)), name)
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Map a label name onto an existing repository label.
+
+        Only case, separator ('-', '_', spaces) and trailing-'s' plural differences are
+        tolerated, so distinct labels such as 'priority: p1' and 'priority: p2' never match.
+
+        Args:
+            name (str): The label name to resolve, e.g. as suggested by the model.
+
+        Returns:
+            str: The matching repository label, or None if there is no equivalent.
+        """
+        key = _label_key(name)
+        for candidate in (name.strip().casefold(), key, _singular_key(key)):
+            if candidate in self._by_key:
+                return self._by_key[candidate]
+        return None
+
+    def normalize(self, labels: List[str]) -> List[str]:
+        """
+        Map suggested labels onto existing repository labels, dropping any without a match.
+
+        Args:
+            labels (List[str]): Suggested label names.
+
+        Returns:
+            List[str]: Existing repository labels, de-duplicated and in suggestion order.
+        """
+        normalized = []
+        for label in labels:
+            resolved = self.resolve(label)
+            if resolved is None:
+                print(f"Dropping suggested label '{label}': no matching repository label.")
+            elif resolved not in normalized:
+                normalized.append(resolved)
+        return normalized
+
+_label_index_cache: Dict[str, Tuple[float, LabelIndex]] = {}
+
+def get_label_index(token: str, repository: str, ttl: float = DEFAULT_LABEL_CACHE_TTL) -> Optional[LabelIndex]:
+    """
+    Return the label index for a repository, fetching it at most once per TTL window.
+
+    Args:
+        token (str): GitHub access token.
+        repository (str): Repository in 'owner/name' format.
+        ttl (float): Seconds a fetched index stays valid. Defaults to 300.
+
+    Returns:
+        LabelIndex: The repository's label index, or None if the labels cannot be fetched.
+    """
+    cached = _label_index_cache.get(repository)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    try:
+        repo = get_github_client(token).get_repo(repository, lazy=True)
+        index = LabelIndex([label.name for label in iter_pages(repo.get_labels())])
+    except Exception as e:
+        print(f"Error fetching GitHub labels: {type(e).__name__}: {e}", file=sys.stderr)
+        return None
+    _label_index_cache[repository] = (time.monotonic(), index)
+    return index
 
 def get_github_issue(token: str, repository: str, issue_id: int) -> Issue:
     """
@@ -43,7 +249,7 @@ def get_github_issue(token: str, repository: str, issue_id: int) -> Issue:
         SystemExit: If the repository or issue cannot be found or accessed.
     """
     try:
-        github_client = Github(token)
+        github_client = get_github_client(token)
         repo = github_client.get_repo(repository)
         issue = repo.get_issue(issue_id)
         return issue
@@ -51,6 +257,96 @@ def get_github_issue(token: str, repository: str, issue_id: int) -> Issue:
         print(f"Error fetching GitHub issue: {e}", file=sys.stderr)
         sys.exit(1)
 
+def get_github_repo(token: str, repository: str) -> Repository:
+    """
+    Fetch a GitHub repository.
+
+    Args:
+        token (str): GitHub access token.
+        repository (str): Repository in 'owner/name' format.
+
+    Returns:
+        Repository: The fetched GitHub repository object.
+
+    Raises:
+        SystemExit: If the repository cannot be found or accessed.
+    """
+    try:
+        github_client = get_github_client(token)
+        return github_client.get_repo(repository)
+    except Exception as e:
+        print(f"Error fetching GitHub repository: {e}", file=sys.stderr)
+        sys.exit(1)
+
+def iter_github_issues(repo: Repository, check_all: bool = False) -> Iterator[IssueRecord]:
+    """
+    Stream the open issues that a sweep should consider as compact records.
+
+    Args:
+        repo (Repository): The GitHub repository object.
+        check_all (bool): If True, include every open issue not labelled 'vtpm-ignore';
+            otherwise only issues labelled 'vtpm-review'.
+
+    Yields:
+        IssueRecord: The matching open issues, excluding pull requests.
+
+    Raises:
+        SystemExit: If the issues cannot be listed.
+    """
+    try:
+        if check_all:
+            candidates = repo.get_issues(state="open")
+        else:
+            candidates = repo.get_issues(state="open", labels=[GithubLabel.VTPM_REVIEW.value])
+        for issue in iter_pages(candidates):
+            # Checking pull_request would lazily re-fetch every plain issue; html_url is in the listing
+            if "/pull/" in issue.html_url or has_label(issue, GithubLabel.VTPM_IGNORE.value):
+                continue
+            yield IssueRecord.from_issue(issue)
+    except Exception as e:
+        print(f"Error fetching GitHub issues: {e}", file=sys.stderr)
+        sys.exit(1)
+
+def iter_github_comments(issue: Issue) -> Iterator[CommentRecord]:
+    """
+    Stream the comments of a GitHub issue as compact records.
+
+    Args:
+        issue (Issue): The GitHub issue object.
+
+    Yields:
+        CommentRecord: The issue's comments, oldest first.
+    """
+    for comment in iter_pages(issue.get_comments()):
+        yield CommentRecord.from_comment(comment)
+
+def get_ai_evaluation_times(repo: Repository) -> Dict[int, datetime]:
+    """
+    Map issue numbers to the time of their latest AI-enhanced evaluation comment.
+
+    Streams the repository-wide comment listing once, instead of fetching comments per issue.
+
+    Args:
+        repo (Repository): The GitHub repository object.
+
+    Returns:
+        Dict[int, datetime]: Issue number to creation time of its latest AI-enhanced comment.
+
+    Raises:
+        SystemExit: If the comments cannot be listed.
+    """
+    evaluated_at: Dict[int, datetime] = {}
+    try:
+        for comment in iter_pages(repo.get_issues_comments()):
+            if AI_ENHANCED_MARKER.lower() not in (comment.body or "").lower():
+                continue
+            number = int(comment.issue_url.rstrip("/").rsplit("/", 1)[-1])
+            if number not in evaluated_at or comment.created_at > evaluated_at[number]:
+                evaluated_at[number] = comment.created_at
+    except Exception as e:
+        print(f"Error fetching GitHub issue comments: {e}", file=sys.stderr)
+        sys.exit(1)
+    return evaluated_at
 
 def create_github_issue_comment(issue: Issue, comment: str) -> bool:
     """
@@ -81,14 +377,17 @@ def get_ai_enhanced_comment(issue: Issue) -> str:
     Returns:
         str: The content of the AI-enhanced comment, or None if not found.
     """
-    for comment in reversed(list(issue.get_comments())):
-        if "AI-enhanced Evaluation".lower() in comment.body.lower():
-            print(f"Found AI-enhanced comment in issue #{issue.number} (comment id: {comment.id}).")
-            return comment.body
+    latest: Optional[CommentRecord] = None
+    for comment in iter_github_comments(issue):
+        if AI_ENHANCED_MARKER.lower() in comment.body.lower():
+            latest = comment
+    if latest is not None:
+        print(f"Found AI-enhanced comment in issue #{issue.number} (comment id: {latest.id}).")
+        return latest.body
     print(f"No AI-enhanced comment found in issue #{issue.number}.")
     return None
 
-def get_github_comment(issue: Issue, comment_id: int):
+def get_github_comment(issue: Issue, comment_id: int) -> CommentRecord:
     """
     Retrieve a specific comment by its ID from a GitHub issue.
 
@@ -97,14 +396,13 @@ def get_github_comment(issue: Issue, comment_id: int):
         comment_id (int): The ID of the comment to retrieve.
 
     Returns:
-        The comment object if found.
+        CommentRecord: The comment record if found.
 
     Raises:
         Exception: If the comment is not found or another error occurs.
     """
     try:
-        comments = issue.get_comments()
-        for comment in comments:
+        for comment in iter_github_comments(issue):
             if comment.id == comment_id:
                 print(f"Found comment with id {comment_id} in issue #{issue.number}.")
                 return comment
@@ -1,5 +1,7 @@
 import sys
-import asyncio
+import time
+from datetime import timedelta
+from typing import Optional
 
 # Third-party imports
 from github.Issue import Issue
@@ -10,37 +12,131 @@ from github_utils import (
     GithubEvent,
     GithubLabel,
     get_github_issue,
+    get_github_repo,
+    get_ai_evaluation_times,
+    get_label_index,
+    LabelIndex,
+    iter_github_issues,
+    IssueRecord,
     get_github_comment,
     get_ai_enhanced_comment,
     has_label,
     create_github_issue_comment,
     update_github_issue,
 )
-from openai_utils import initialize_kernel, run_completion
+from openai_utils import initialize_kernel, run_completion_with_usage
 from prompts import build_user_story_eval_prompt
 from utils import get_env_var
 from response_models import UserStoryEvalResponse
+from scheduler import BudgetScheduler
+from evaluation_store import EvaluationStore, compute_content_hash
+from transport import close_transport, format_connection_metrics, run_async
 
 COMMENT_LOOKUP = "/apply"
+SWEEP_EVENTS = [GithubEvent.SCHEDULE.value, GithubEvent.WORKFLOW_DISPATCH.value]
+# Posting the evaluation comment itself bumps the issue's updated_at.
+EVALUATION_UPDATE_GRACE = timedelta(minutes=1)
 
-def handle_github_issues_event(issue: Issue, kernel: Kernel) -> None:
+def open_evaluation_store(path: str) -> Optional[EvaluationStore]:
     """
-    Handle GitHub issue events by generating and posting an AI-enhanced evaluation comment.
+    Open the local evaluation store, or return None if it is disabled or unavailable.
     """
-    messages = build_user_story_eval_prompt(issue.title, issue.body)
-
+    if not path:
+        return None
+    try:
+        return EvaluationStore(path)
+    except Exception as e:
+        print(f"Error opening evaluation store at {path}: {e}", file=sys.stderr)
+        return None
+
+
+def record_evaluation(
+    store: Optional[EvaluationStore],
+    repository: str,
+    issue: Issue,
+    evaluation: UserStoryEvalResponse,
+    duration_ms: float,
+    usage: dict,
+) -> None:
+    """
+    Persist an evaluation to the local store without failing the run if the write fails.
+    """
+    if store is None:
+        return
     try:
-        response_text = asyncio.run(run_completion(kernel, messages))
-        response = UserStoryEvalResponse.from_text(response_text).to_markdown()
+        store.record(
+            repository=repository,
+            issue_number=issue.number,
+            content_hash=compute_content_hash(issue.title, issue.body),
+            evaluation=evaluation,
+            issue_labels=[label.name for label in issue.labels],
+            duration_ms=duration_ms,
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+        )
+    except Exception as e:
+        print(f"Error recording evaluation for issue #{issue.number}: {e}", file=sys.stderr)
+
+
+def evaluate_github_issue(
+    issue: Issue,
+    kernel: Kernel,
+    store: Optional[EvaluationStore] = None,
+    repository: str = "",
+    label_index: Optional[LabelIndex] = None,
+) -> dict:
+    """
+    Generate and post an AI-enhanced evaluation comment for an issue.
 
-        create_github_issue_comment(issue, response)
-        print(f"AI Response for Issue {issue.number} (Markdown):\n\n{response}")
+    Returns:
+        dict: Token usage reported by the service ('prompt_tokens', 'completion_tokens').
+
+    Raises:
+        Exception: If the completion or parsing fails.
+    """
+    messages = build_user_story_eval_prompt(
+        issue.title, issue.body, allowed_labels=label_index.names if label_index else None
+    )
+
+    started = time.perf_counter()
+    response_text, usage = run_async(run_completion_with_usage(kernel, messages))
+    duration_ms = (time.perf_counter() - started) * 1000
+    evaluation = UserStoryEvalResponse.from_text(response_text)
+    if label_index is not None:
+        evaluation.labels = label_index.normalize(evaluation.labels)
+    response = evaluation.to_markdown()
+
+    # Only record what the user can see, so /apply never applies an unposted evaluation
+    if create_github_issue_comment(issue, response):
+        record_evaluation(store, repository, issue, evaluation, duration_ms, usage)
+    print(f"AI Response for Issue {issue.number} (Markdown):\n\n{response}")
+    return usage
+
+
+def handle_github_issues_event(
+    issue: Issue,
+    kernel: Kernel,
+    store: Optional[EvaluationStore] = None,
+    repository: str = "",
+    label_index: Optional[LabelIndex] = None,
+) -> None:
+    """
+    Handle GitHub issue events by generating and posting an AI-enhanced evaluation comment.
+    """
+    try:
+        evaluate_github_issue(issue, kernel, store, repository, label_index)
     except Exception as e:
         print(f"Error running Azure OpenAI completion: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def handle_github_comment_event(issue: Issue, issue_comment_id: int) -> None:
+def handle_github_comment_event(
+    issue: Issue,
+    issue_comment_id: int,
+    store: Optional[EvaluationStore] = None,
+    repository: str = "",
+    github_token: str = "",
+) -> None:
     """
     Handle GitHub issue comment events by applying AI-suggested enhancements if requested.
     """
@@ -50,12 +146,26 @@ def handle_github_comment_event(issue: Issue, issue_comment_id: int) -> None:
         print(f"Comment {issue_comment_id} does not require processing.")
         return
 
-    ai_enhanced_comment = get_ai_enhanced_comment(issue)
+    user_story_eval = None
+    if store is not None:
+        # Only reuse a stored evaluation of the issue content as it currently stands
+        user_story_eval = store.latest(
+            repository, issue.number, content_hash=compute_content_hash(issue.title, issue.body)
+        )
+        if user_story_eval is not None:
+            print(f"Found stored evaluation for issue #{issue.number}.")
 
-    if ai_enhanced_comment is None:
-        return
+    if user_story_eval is None:
+        ai_enhanced_comment = get_ai_enhanced_comment(issue)
+
+        if ai_enhanced_comment is None:
+            return
 
-    user_story_eval = UserStoryEvalResponse.from_markdown(ai_enhanced_comment)
+        user_story_eval = UserStoryEvalResponse.from_markdown(ai_enhanced_comment)
+
+    label_index = get_label_index(github_token, repository) if github_token else None
+    if label_index is not None:
+        user_story_eval.labels = label_index.normalize(user_story_eval.labels)
 
     update_github_issue(
         issue,
@@ -77,6 +187,54 @@ def handle_github_comment_event(issue: Issue, issue_comment_id: int) -> None:
     )
 
 
+def handle_github_sweep_event(
+    token: str,
+    repository: str,
+    check_all: bool,
+    kernel: Kernel,
+    scheduler: BudgetScheduler,
+    store: Optional[EvaluationStore] = None,
+    label_index: Optional[LabelIndex] = None,
+) -> None:
+    """
+    Handle scheduled or manual sweeps by evaluating open issues in priority order within the run budget.
+    """
+    repo = get_github_repo(token=token, repository=repository)
+
+    # Without a store, one pass over the repository's comments finds prior AI evaluations
+    ai_evaluated_at = get_ai_evaluation_times(repo) if store is None else {}
+
+    def has_prior_evaluation(record: IssueRecord) -> bool:
+        if store is not None:
+            return store.latest(repository, record.number) is not None
+        return record.number in ai_evaluated_at
+
+    def needs_evaluation(record: IssueRecord) -> bool:
+        if store is not None:
+            content_hash = compute_content_hash(record.title, record.body)
+            return store.latest(repository, record.number, content_hash=content_hash) is None
+        evaluated_at = ai_evaluated_at.get(record.number)
+        return evaluated_at is None or record.updated_at > evaluated_at + EVALUATION_UPDATE_GRACE
+
+    report = scheduler.run(
+        iter_github_issues(repo, check_all=check_all),
+        process=lambda record: evaluate_github_issue(
+            repo.get_issue(record.number), kernel, store, repository, label_index
+        ),
+        has_prior_evaluation=has_prior_evaluation,
+        needs_evaluation=needs_evaluation,
+    )
+
+    print(
+        f"Sweep considered "
+        f"{len(report.skipped) + len(report.processed) + len(report.failed) + len(report.deferred)} "
+        f"issue(s) in {repository}."
+    )
+    print(report.to_text())
+    if report.budget_exhausted:
+        print("Sweep stopped early: run budget exhausted.")
+
+
 def main() -> None:
     """Main entry point for the issue enhancer agent."""
 
@@ -87,58 +245,110 @@ def main() -> None:
         default=False,
     )
     github_event_name = get_env_var("INPUT_GITHUB_EVENT_NAME")
-    github_issue_id = get_env_var("INPUT_GITHUB_ISSUE_ID", cast_func=int)
     github_token = get_env_var("INPUT_GITHUB_TOKEN")
 
     repository = get_env_var("GITHUB_REPOSITORY")
-
-    if github_event_name not in [e.value for e in GithubEvent]:
-        print(f"Error: Unsupported GitHub event: {github_event_name}", file=sys.stderr)
-        sys.exit(1)
-
-    github_issue = get_github_issue(
-        token=github_token, repository=repository, issue_id=github_issue_id
+    store = open_evaluation_store(
+        get_env_var("INPUT_EVALUATION_STORE_PATH", required=False, default="")
     )
 
-    if check_all and has_label(github_issue, GithubLabel.VTPM_IGNORE.value):
-        print(
-            f"Issue {github_issue_id} is ignored due to label {GithubLabel.VTPM_IGNORE.value}."
+    try:
+        if github_event_name not in [e.value for e in GithubEvent]:
+            print(f"Error: Unsupported GitHub event: {github_event_name}", file=sys.stderr)
+            sys.exit(1)
+
+        if github_event_name in SWEEP_EVENTS:
+
+            azure_openai_target_uri = get_env_var("INPUT_AZURE_OPENAI_TARGET_URI")
+            azure_openai_api_key = get_env_var("INPUT_AZURE_OPENAI_API_KEY")
+            label_index = get_label_index(github_token, repository)
+
+            scheduler = BudgetScheduler(
+                max_tokens=get_env_var(
+                    "INPUT_MAX_RUN_TOKENS",
+                    required=False,
+                    cast_func=lambda v: int(v) if str(v).strip() else None,
+                ),
+                max_cost=get_env_var(
+                    "INPUT_MAX_RUN_COST",
+                    required=False,
+                    cast_func=lambda v: float(v) if str(v).strip() else None,
+                ),
+                cost_per_1k_tokens=get_env_var(
+                    "INPUT_COST_PER_1K_TOKENS",
+                    required=False,
+                    cast_func=lambda v: float(v) if str(v).strip() else 0.0,
+                    default=0.0,
+                ),
+                allowed_labels=label_index.names if label_index else None,
+            )
+
+            kernel = initialize_kernel(
+                azure_openai_target_uri=azure_openai_target_uri,
+                azure_openai_api_key=azure_openai_api_key,
+            )
+
+            handle_github_sweep_event(
+                github_token, repository, check_all, kernel, scheduler, store, label_index
+            )
+            return
+
+        github_issue_id = get_env_var("INPUT_GITHUB_ISSUE_ID", cast_func=int)
+
+        github_issue = get_github_issue(
+            token=github_token, repository=repository, issue_id=github_issue_id
         )
-        return
 
-    if not check_all and not has_label(github_issue, GithubLabel.VTPM_REVIEW.value):
-        print(
-            f"Issue {github_issue_id} does not require review due to missing label {GithubLabel.VTPM_REVIEW.value}."
-        )
-        return
+        if check_all and has_label(github_issue, GithubLabel.VTPM_IGNORE.value):
+            print(
+                f"Issue {github_issue_id} is ignored due to label {GithubLabel.VTPM_IGNORE.value}."
+            )
+            return
 
-    print(f"Processing issue: {github_issue.title}")
-    print(f"Event Name: {github_event_name}")
+        if not check_all and not has_label(github_issue, GithubLabel.VTPM_REVIEW.value):
+            print(
+                f"Issue {github_issue_id} does not require review due to missing label {GithubLabel.VTPM_REVIEW.value}."
+            )
+            return
 
-    if github_event_name == GithubEvent.ISSUE.value:
+        print(f"Processing issue: {github_issue.title}")
+        print(f"Event Name: {github_event_name}")
 
-        azure_openai_target_uri = get_env_var("INPUT_AZURE_OPENAI_TARGET_URI")
-        azure_openai_api_key = get_env_var("INPUT_AZURE_OPENAI_API_KEY")
+        if github_event_name == GithubEvent.ISSUE.value:
 
-        kernel = initialize_kernel(
-            azure_openai_target_uri=azure_openai_target_uri,
-            azure_openai_api_key=azure_openai_api_key,
-        )
+            azure_openai_target_uri = get_env_var("INPUT_AZURE_OPENAI_TARGET_URI")
+            azure_openai_api_key = get_env_var("INPUT_AZURE_OPENAI_API_KEY")
 
-        handle_github_issues_event(github_issue, kernel)
+            kernel = initialize_kernel(
+                azure_openai_target_uri=azure_openai_target_uri,
+                azure_openai_api_key=azure_openai_api_key,
+            )
 
-    elif github_event_name == GithubEvent.ISSUE_COMMENT.value:
+            label_index = get_label_index(github_token, repository)
 
-        github_issue_comment_id = get_env_var(
-            "INPUT_GITHUB_ISSUE_COMMENT_ID"
-        )
-    
-        handle_github_comment_event(github_issue, int(github_issue_comment_id))
+            handle_github_issues_event(github_issue, kernel, store, repository, label_index)
 
-    else:
-        print(f"Unsupported GitHub event: {github_event_name}", file=sys.stderr)
-        sys.exit(1)
+        elif github_event_name == GithubEvent.ISSUE_COMMENT.value:
+
+            github_issue_comment_id = get_env_var(
+                "INPUT_GITHUB_ISSUE_COMMENT_ID"
+            )
+
+            handle_github_comment_event(
+                github_issue, int(github_issue_comment_id), store, repository, github_token
+            )
+
+        else:
+            print(f"Unsupported GitHub event: {github_event_name}", file=sys.stderr)
+            sys.exit(1)
+    finally:
+        if store is not None:
+            store.close()
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        print(format_connection_metrics())
+        close_transport()
@@ -1,13 +1,16 @@
 import sys
 import re
-from typing import List
+from typing import Dict, List, Tuple
 from urllib.parse import urlparse, parse_qs
+from openai import AsyncAzureOpenAI
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
 from semantic_kernel.contents import ChatHistory
 from semantic_kernel.connectors.ai.open_ai import AzureChatPromptExecutionSettings
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 
+from transport import get_openai_http_client
+
 def parse_azure_openai_uri(target_url: str):
     """
     Parse a full Azure OpenAI chat completions URL and extract endpoint, deployment name, and API version.
@@ -39,6 +42,8 @@ def initialize_kernel(
     """
     Initialize and return a Semantic Kernel with Azure OpenAI chat completion service.
 
+    The service uses the process-wide pooled HTTP client from the transport module.
+
     Args:
         azure_openai_target_uri (str): Full Azure OpenAI chat completions URL.
         azure_openai_api_key (str): The API key for Azure OpenAI.
@@ -54,6 +59,12 @@ def initialize_kernel(
     )
     kernel = Kernel()
     try:
+        async_client = AsyncAzureOpenAI(
+            azure_endpoint=endpoint,
+            api_key=azure_openai_api_key,
+            api_version=api_version,
+            http_client=get_openai_http_client(),
+        )
         kernel.add_service(
             AzureChatCompletion(
                 service_id="azure-openai",
@@ -61,6 +72,7 @@ def initialize_kernel(
                 endpoint=endpoint,
                 deployment_name=deployment_name,
                 api_version=api_version,
+                async_client=async_client,
             )
         )
         return kernel
@@ -81,6 +93,25 @@ async def run_completion(kernel: Kernel, messages: List) -> str:
     Returns:
         str: The content of the completion response.
 
+    Raises:
+        SystemExit: If the chat service is not available.
+    """
+    content, _ = await run_completion_with_usage(kernel, messages)
+    return content
+
+
+async def run_completion_with_usage(kernel: Kernel, messages: List) -> Tuple[str, Dict[str, int]]:
+    """
+    Run a chat completion and also return the token usage reported by the service.
+
+    Args:
+        kernel (Kernel): The Semantic Kernel instance with Azure OpenAI service.
+        messages (List): List of message dicts with 'role' and 'content'.
+
+    Returns:
+        tuple: (content, usage) where usage holds 'prompt_tokens' and 'completion_tokens'
+            (0 when the service does not report usage).
+
     Raises:
         SystemExit: If the chat service is not available.
     """
@@ -111,5 +142,9 @@ async def run_completion(kernel: Kernel, messages: List) -> str:
         kernel_arguments=KernelArguments(),
     )
 
-    return result.content
+    usage = (getattr(result, "metadata", None) or {}).get("usage")
+    return result.content, {
+        "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+        "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+    }
 
@@ -1,8 +1,25 @@
-from typing import Dict
+from typing import Dict, List, Optional
 
 SYSTEM_PROMPT = "You are a helpful assistant that analyzes and improves GitHub issues using natural language."
 
-def build_user_story_eval_prompt(issue_title: str, issue_body: str) -> list:
+def build_user_story_eval_prompt(
+    issue_title: str, issue_body: str, allowed_labels: Optional[List[str]] = None
+) -> list:
+    if allowed_labels is None:
+        label_instruction = (
+            "5. Suggest up to 3 relevant GitHub labels (e.g. 'bug', 'enhancement', 'good first issue'). Format as a comma-separated list.\n"
+        )
+    elif allowed_labels:
+        label_instruction = (
+            "5. Suggest up to 3 relevant GitHub labels, chosen ONLY from this list of existing repository labels: "
+            f"{', '.join(allowed_labels)}. Use the names exactly as written. Format as a comma-separated list.\n"
+        )
+    else:
+        # Every suggestion would be dropped by label normalization, so ask for none
+        label_instruction = (
+            "5. This repository has no labels available for suggestion. Leave the Labels field empty.\n"
+        )
+
     prompt = (
         f"## GitHub Issue Context\n"
         f"Title: {issue_title}\n"
@@ -19,7 +36,7 @@ def build_user_story_eval_prompt(issue_title: str, issue_body: str) -> list:
         "3. Judge the clarity and completeness of the description. Does it convey why the story matters (business value, user need, technical dependency)?\n"
         "4. Analyze the acceptance criteria for clarity, specificity, and testability via automation.\n"
         "   - If not automatable, include a warning and suggest improvements.\n"
-        "5. Suggest up to 3 relevant GitHub labels (e.g. 'bug', 'enhancement', 'good first issue'). Format as a comma-separated list.\n"
+        f"{label_instruction}"
         "6. Render a Boolean judgment: Is this story 'Ready to Work'? Criteria: all elements present, clear purpose, and testable acceptance criteria.\n\n"
 
         "⚠️ If the title or description is vague, placeholder-like, or lacks meaningful value (e.g. 'Test', 'TBD', 'No update provided'), then:\n"
@@ -17,6 +17,13 @@ class UserStoryRefactored:
             acceptance_criteria=data.get("acceptance_criteria", []),
         )
 
+    def to_dict(self) -> dict:
+        return {
+            "title": self.title,
+            "description": self.description,
+            "acceptance_criteria": list(self.acceptance_criteria or []),
+        }
+
     @classmethod
     def from_markdown(cls, markdown: str):
         """
@@ -95,6 +102,35 @@ class UserStoryEvalResponse:
         self.base_story_not_clear = base_story_not_clear
         self.refactored = refactored or UserStoryRefactored()
 
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            summary=data.get("summary", ""),
+            title_complete=bool(data.get("title_complete", False)),
+            description_complete=bool(data.get("description_complete", False)),
+            acceptance_criteria_complete=bool(data.get("acceptance_criteria_complete", False)),
+            importance=data.get("importance", ""),
+            acceptance_criteria_evaluation=data.get("acceptance_criteria_evaluation", ""),
+            labels=list(data.get("labels", [])),
+            ready_to_work=bool(data.get("ready_to_work", False)),
+            base_story_not_clear=bool(data.get("base_story_not_clear", False)),
+            refactored=UserStoryRefactored.from_dict(data.get("refactored") or {}),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "summary": self.summary,
+            "title_complete": self.title_complete,
+            "description_complete": self.description_complete,
+            "acceptance_criteria_complete": self.acceptance_criteria_complete,
+            "importance": self.importance,
+            "acceptance_criteria_evaluation": self.acceptance_criteria_evaluation,
+            "labels": list(self.labels),
+            "ready_to_work": self.ready_to_work,
+            "base_story_not_clear": self.base_story_not_clear,
+            "refactored": self.refactored.to_dict(),
+        }
+
     @classmethod
     def from_text(cls, text: str):
         """
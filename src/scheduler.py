@@ -0,0 +1,236 @@
+import sys
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from github_utils import GithubLabel, IssueRecord, has_label
+from prompts import build_user_story_eval_prompt
+
+# Rough characters-per-token ratio for English prose on GPT-family tokenizers.
+CHARS_PER_TOKEN = 4
+# Per-message framing overhead added by the chat completions format.
+TOKENS_PER_MESSAGE = 4
+# Tokens reserved for the model's reply when estimating the cost of an issue.
+DEFAULT_COMPLETION_TOKEN_RESERVE = 800
+# Recency is compared at day granularity so later sort keys can break ties.
+RECENCY_BUCKET_SECONDS = 86400
+
+
+def estimate_prompt_tokens(messages: List) -> int:
+    """
+    Estimate the number of prompt tokens for a list of chat messages.
+
+    Args:
+        messages (List): List of message dicts with 'role' and 'content'.
+
+    Returns:
+        int: Estimated number of prompt tokens.
+    """
+    total = 0
+    for msg in messages:
+        content = msg.get("content", "") or ""
+        total += TOKENS_PER_MESSAGE + (len(content) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+    return total
+
+
+def issue_priority(issue: IssueRecord, has_prior_evaluation: bool) -> tuple:
+    """
+    Build the sort key used to order issues in a sweep (lower sorts first).
+
+    Issues labelled 'vtpm-review' come first, then the most recently updated
+    (by day), then issues that have not yet received an AI evaluation.
+
+    Args:
+        issue (IssueRecord): The GitHub issue record.
+        has_prior_evaluation (bool): Whether the issue already has an AI-enhanced comment.
+
+    Returns:
+        tuple: Sort key for the issue.
+    """
+    updated_at = getattr(issue, "updated_at", None)
+    recency = -int(updated_at.timestamp() // RECENCY_BUCKET_SECONDS) if updated_at else 0
+    return (
+        0 if has_label(issue, GithubLabel.VTPM_REVIEW.value) else 1,
+        recency,
+        1 if has_prior_evaluation else 0,
+    )
+
+
+class ScheduledIssue:
+    """
+    An issue queued for evaluation together with its estimated cost.
+    """
+    __slots__ = ("issue", "estimated_tokens", "estimated_cost")
+
+    def __init__(self, issue: IssueRecord, estimated_tokens: int, estimated_cost: float):
+        self.issue = issue
+        self.estimated_tokens = estimated_tokens
+        self.estimated_cost = estimated_cost
+
+
+class BudgetReport:
+    """
+    Outcome of a budgeted sweep: what was processed, what was deferred and what was spent.
+    """
+    def __init__(self, max_tokens: Optional[int], max_cost: Optional[float]):
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.processed: List[ScheduledIssue] = []
+        self.failed: List[Tuple[ScheduledIssue, str]] = []
+        self.deferred: List[ScheduledIssue] = []
+        self.skipped: List[int] = []
+        self.tokens_used = 0
+        self.cost_used = 0.0
+
+    @property
+    def budget_exhausted(self) -> bool:
+        return bool(self.deferred)
+
+    def to_text(self) -> str:
+        """
+        Convert the report to a human-readable summary for the action log.
+        """
+        token_limit = self.max_tokens if self.max_tokens is not None else "unlimited"
+        cost_limit = f"{self.max_cost:.4f}" if self.max_cost is not None else "unlimited"
+        lines = [
+            "Sweep budget report:",
+            f" - Skipped (unchanged since last evaluation): {len(self.skipped)} issue(s)",
+            f" - Processed: {len(self.processed)} issue(s)",
+            f" - Tokens used: {self.tokens_used} / {token_limit}",
+            f" - Cost: {self.cost_used:.4f} / {cost_limit}",
+            f" - Failed: {len(self.failed)} issue(s)",
+        ]
+        for item, error in self.failed:
+            lines.append(f"   - #{item.issue.number} {item.issue.title}: {error}")
+        lines.append(f" - Deferred: {len(self.deferred)} issue(s)")
+        for item in self.deferred:
+            lines.append(
+                f"   - #{item.issue.number} {item.issue.title} "
+                f"(~{item.estimated_tokens} tokens, ~{item.estimated_cost:.4f})"
+            )
+        return "\n".join(lines)
+
+
+class BudgetScheduler:
+    """
+    Orders issues by priority and processes them until a per-run token or cost ceiling is reached.
+    """
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        max_cost: Optional[float] = None,
+        cost_per_1k_tokens: float = 0.0,
+        completion_token_reserve: int = DEFAULT_COMPLETION_TOKEN_RESERVE,
+        allowed_labels: Optional[List[str]] = None,
+    ):
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.cost_per_1k_tokens = cost_per_1k_tokens
+        self.completion_token_reserve = completion_token_reserve
+        self.allowed_labels = allowed_labels
+
+    def estimate(self, issue: IssueRecord) -> ScheduledIssue:
+        """
+        Estimate the token and cost footprint of evaluating an issue from its built prompt.
+
+        The record's body is released once estimated; the issue is fetched again when processed.
+        """
+        messages = build_user_story_eval_prompt(issue.title, issue.body, self.allowed_labels)
+        tokens = estimate_prompt_tokens(messages) + self.completion_token_reserve
+        cost = tokens / 1000 * self.cost_per_1k_tokens
+        issue.body = None
+        return ScheduledIssue(issue, tokens, cost)
+
+    def plan(
+        self,
+        issues: Iterable[IssueRecord],
+        has_prior_evaluation: Callable[[IssueRecord], bool],
+    ) -> List[ScheduledIssue]:
+        """
+        Estimate every issue and return them in priority order.
+
+        Args:
+            issues (Iterable[IssueRecord]): Candidate issues for the sweep.
+            has_prior_evaluation (Callable[[IssueRecord], bool]): Predicate reporting whether an
+                issue already has an AI evaluation.
+
+        Returns:
+            List[ScheduledIssue]: Issues in the order they should be processed.
+        """
+        keyed = [
+            (issue_priority(issue, has_prior_evaluation(issue)), index, self.estimate(issue))
+            for index, issue in enumerate(issues)
+        ]
+        keyed.sort(key=lambda entry: (entry[0], entry[1]))
+        return [entry[2] for entry in keyed]
+
+    def fits(self, report: BudgetReport, item: ScheduledIssue) -> bool:
+        """
+        Check whether processing an item keeps the run within its token and cost ceilings.
+        """
+        if self.max_tokens is not None and report.tokens_used + item.estimated_tokens > self.max_tokens:
+            return False
+        if self.max_cost is not None and report.cost_used + item.estimated_cost > self.max_cost:
+            return False
+        return True
+
+    def charge(self, report: BudgetReport, item: ScheduledIssue, usage: Optional[dict]) -> None:
+        """
+        Add an issue's spend to the report, using reported token usage and falling back to the estimate.
+        """
+        usage = usage or {}
+        tokens = usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0)
+        if tokens <= 0:
+            report.tokens_used += item.estimated_tokens
+            report.cost_used += item.estimated_cost
+            return
+        report.tokens_used += tokens
+        report.cost_used += tokens / 1000 * self.cost_per_1k_tokens
+
+    def run(
+        self,
+        issues: Iterable[IssueRecord],
+        process: Callable[[IssueRecord], Optional[dict]],
+        has_prior_evaluation: Callable[[IssueRecord], bool],
+        needs_evaluation: Optional[Callable[[IssueRecord], bool]] = None,
+    ) -> BudgetReport:
+        """
+        Process issues in priority order, stopping cleanly once the next issue would exceed the budget.
+
+        A failure on one issue is recorded on the report and charged at its estimate;
+        the sweep then continues with the next issue.
+
+        Args:
+            issues (Iterable[IssueRecord]): Candidate issues for the sweep.
+            process (Callable[[IssueRecord], Optional[dict]]): Handler invoked for each issue within
+                budget, returning the token usage reported by the service.
+            has_prior_evaluation (Callable[[IssueRecord], bool]): Predicate reporting whether an
+                issue already has an AI evaluation.
+            needs_evaluation (Callable[[IssueRecord], bool], optional): Predicate reporting whether
+                an issue changed since its last evaluation; issues for which it is False are skipped.
+
+        Returns:
+            BudgetReport: Summary of processed, failed, skipped and deferred issues.
+        """
+        report = BudgetReport(self.max_tokens, self.max_cost)
+
+        def candidates():
+            for issue in issues:
+                if needs_evaluation is not None and not needs_evaluation(issue):
+                    report.skipped.append(issue.number)
+                    continue
+                yield issue
+
+        queue = self.plan(candidates(), has_prior_evaluation)
+        for position, item in enumerate(queue):
+            if not self.fits(report, item):
+                report.deferred = queue[position:]
+                break
+            try:
+                usage = process(item.issue)
+            except Exception as e:
+                print(f"Error processing issue #{item.issue.number}: {type(e).__name__}: {e}", file=sys.stderr)
+                report.failed.append((item, f"{type(e).__name__}: {e}"))
+                self.charge(report, item, None)
+                continue
+            report.processed.append(item)
+            self.charge(report, item, usage)
+        return report
@@ -0,0 +1,239 @@
+import asyncio
+import math
+import sys
+from typing import Dict, List, Optional
+
+import httpx
+from github import Auth, Github
+
+from utils import get_env_var
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+DEFAULT_PAGE_SIZE = 50
+
+
+class TransportConfig:
+    """
+    Tunable settings shared by the GitHub and Azure OpenAI HTTP clients.
+    """
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        http2: bool = True,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.http2 = http2
+        self.keepalive_expiry = keepalive_expiry
+        self.page_size = page_size
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            pool_size=get_env_var(
+                "INPUT_HTTP_POOL_SIZE",
+                required=False,
+                cast_func=lambda v: int(v) if str(v).strip() else DEFAULT_POOL_SIZE,
+                default=DEFAULT_POOL_SIZE,
+            ),
+            timeout=get_env_var(
+                "INPUT_HTTP_TIMEOUT",
+                required=False,
+                cast_func=lambda v: float(v) if str(v).strip() else DEFAULT_TIMEOUT,
+                default=DEFAULT_TIMEOUT,
+            ),
+            http2=get_env_var(
+                "INPUT_HTTP2",
+                required=False,
+                cast_func=lambda v: str(v).strip().lower() not in ["0", "false", "no"],
+                default=True,
+            ),
+            page_size=get_env_var(
+                "INPUT_GITHUB_PAGE_SIZE",
+                required=False,
+                cast_func=lambda v: min(max(int(v), 1), 100) if str(v).strip() else DEFAULT_PAGE_SIZE,
+                default=DEFAULT_PAGE_SIZE,
+            ),
+        )
+
+
+class ConnectionMetrics:
+    """
+    Counts requests and newly opened connections for one client.
+    """
+    def __init__(self, name: str, available: bool = True):
+        self.name = name
+        self.available = available
+        self.requests = 0
+        self.connections = 0
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.connections, 0)
+
+    def to_text(self) -> str:
+        if not self.available:
+            return f" - {self.name}: metrics unavailable"
+        return (
+            f" - {self.name}: {self.requests} request(s), {self.connections} connection(s) opened, "
+            f"{self.reused} reused"
+        )
+
+
+_config: Optional[TransportConfig] = None
+_github_clients: Dict[str, Github] = {}
+_openai_http_client: Optional[httpx.AsyncClient] = None
+_openai_metrics = ConnectionMetrics("Azure OpenAI")
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_transport_config() -> TransportConfig:
+    """
+    Return the process-wide transport configuration, reading it from the environment on first use.
+    """
+    global _config
+    if _config is None:
+        _config = TransportConfig.from_env()
+    return _config
+
+
+def get_github_client(token: str) -> Github:
+    """
+    Return a shared GitHub client for the token, creating it with a pooled keep-alive session on first use.
+
+    Args:
+        token (str): GitHub access token.
+
+    Returns:
+        Github: The shared GitHub client.
+    """
+    client = _github_clients.get(token)
+    if client is None:
+        config = get_transport_config()
+        client = Github(
+            auth=Auth.Token(token),
+            # PyGithub only accepts whole seconds
+            timeout=max(int(math.ceil(config.timeout)), 1),
+            pool_size=config.pool_size,
+            per_page=config.page_size,
+        )
+        _github_clients[token] = client
+    return client
+
+
+async def _on_openai_request(request: httpx.Request) -> None:
+    _openai_metrics.requests += 1
+    request.extensions["trace"] = _on_openai_trace
+
+
+async def _on_openai_trace(event_name: str, info: dict) -> None:
+    if event_name == "connection.connect_tcp.complete":
+        _openai_metrics.connections += 1
+
+
+def get_openai_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared async HTTP client used by the Azure OpenAI service.
+
+    HTTP/2 is enabled when configured and the 'h2' package is installed; otherwise
+    the client falls back to HTTP/1.1 keep-alive connections.
+
+    Returns:
+        httpx.AsyncClient: The shared HTTP client.
+    """
+    global _openai_http_client
+    if _openai_http_client is None:
+        config = get_transport_config()
+        options = dict(
+            limits=httpx.Limits(
+                max_connections=config.pool_size,
+                max_keepalive_connections=config.pool_size,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(config.timeout),
+            event_hooks={"request": [_on_openai_request]},
+        )
+        try:
+            _openai_http_client = httpx.AsyncClient(http2=config.http2, **options)
+        except ImportError:
+            print("HTTP/2 support is not installed; falling back to HTTP/1.1.", file=sys.stderr)
+            _openai_http_client = httpx.AsyncClient(http2=False, **options)
+    return _openai_http_client
+
+
+def run_async(coro):
+    """
+    Run a coroutine on the process-wide event loop.
+
+    Unlike asyncio.run, the loop is kept open between calls so pooled async
+    connections stay alive across completions.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+def _github_metrics() -> ConnectionMetrics:
+    # Pool stats are read from each client's persistent PyGithub connection. These are
+    # PyGithub/urllib3 internals, so any missing attribute reports the metrics as unavailable.
+    metrics = ConnectionMetrics("GitHub")
+    try:
+        for client in _github_clients.values():
+            requester = getattr(client, "requester", None)
+            connection = getattr(requester, "_Requester__connection", None)
+            if connection is None:
+                continue
+            pools = getattr(getattr(getattr(connection, "adapter", None), "poolmanager", None), "pools", None)
+            if pools is None:
+                return ConnectionMetrics("GitHub", available=False)
+            for key in pools.keys():
+                pool = pools[key]
+                metrics.requests += getattr(pool, "num_requests", 0)
+                metrics.connections += getattr(pool, "num_connections", 0)
+    except Exception:
+        return ConnectionMetrics("GitHub", available=False)
+    return metrics
+
+
+def get_connection_metrics() -> List[ConnectionMetrics]:
+    """
+    Return connection reuse metrics for the shared GitHub and Azure OpenAI clients.
+    """
+    return [_github_metrics(), _openai_metrics]
+
+
+def format_connection_metrics() -> str:
+    """
+    Format connection reuse metrics for the action log.
+    """
+    lines = ["HTTP transport metrics:"]
+    lines.extend(metrics.to_text() for metrics in get_connection_metrics())
+    return "\n".join(lines)
+
+
+def close_transport() -> None:
+    """
+    Close the shared HTTP clients and event loop.
+    """
+    global _openai_http_client, _loop
+    if _openai_http_client is not None:
+        run_async(_openai_http_client.aclose())
+        _openai_http_client = None
+    for client in _github_clients.values():
+        client.close()
+    _github_clients.clear()
+    if _loop is not None and not _loop.is_closed():
+        _loop.close()
+    _loop = None
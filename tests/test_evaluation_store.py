@@ -0,0 +1,91 @@
+import csv
+import io
+import json
+
+import pytest
+
+from evaluation_store import EvaluationStore, compute_content_hash
+from response_models import UserStoryEvalResponse, UserStoryRefactored
+
+
+def make_evaluation(ready=False, unclear=False):
+    return UserStoryEvalResponse(
+        summary="Adds login",
+        title_complete=True,
+        description_complete=True,
+        acceptance_criteria_complete=False,
+        importance="Users need access",
+        acceptance_criteria_evaluation="Missing criteria",
+        labels=["enhancement"],
+        ready_to_work=ready,
+        base_story_not_clear=unclear,
+        refactored=UserStoryRefactored("Login", "Users can log in", ["Given a user, they can log in"]),
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EvaluationStore(str(tmp_path / "nested" / "evaluations.db"))
+    yield store
+    store.close()
+
+
+def test_content_hash_separates_title_and_body():
+    assert compute_content_hash("ab", "c") != compute_content_hash("a", "bc")
+    assert compute_content_hash("a", None) == compute_content_hash("a", "")
+
+
+def test_record_and_latest_round_trip(store):
+    evaluation = make_evaluation()
+    content_hash = compute_content_hash("Login", "body")
+    store.record("o/r", 7, content_hash, evaluation, issue_labels=["vtpm-review"], prompt_tokens=10)
+
+    restored = store.latest("o/r", 7, content_hash=content_hash)
+
+    assert restored.to_dict() == evaluation.to_dict()
+    assert restored.to_markdown() == evaluation.to_markdown()
+
+
+def test_latest_filters_by_content_hash_and_returns_newest(store):
+    store.record("o/r", 7, "old", make_evaluation(ready=False))
+    store.record("o/r", 7, "new", make_evaluation(ready=True))
+
+    assert store.latest("o/r", 7).ready_to_work is True
+    assert store.latest("o/r", 7, content_hash="old").ready_to_work is False
+    assert store.latest("o/r", 7, content_hash="missing") is None
+    assert store.latest("other/repo", 7) is None
+
+
+def test_readiness_summary_uses_latest_evaluation_per_issue(store):
+    store.record("o/r", 1, "h", make_evaluation(), prompt_tokens=100, completion_tokens=20)
+    store.record("o/r", 1, "h2", make_evaluation(ready=True), prompt_tokens=50)
+    store.record("o/r", 2, "h", make_evaluation(unclear=True))
+    store.record("o/r", 3, "h", make_evaluation())
+
+    assert store.readiness_summary("o/r") == {
+        "evaluated": 3,
+        "ready": 1,
+        "needs_refactor": 1,
+        "unclear": 1,
+        "total_tokens": 170,
+    }
+
+
+def test_export_csv_and_jsonl(store):
+    store.record("o/r", 1, "h", make_evaluation())
+    store.record("x/y", 2, "h", make_evaluation())
+
+    out = io.StringIO()
+    assert store.export(out, fmt="csv", repository="o/r") == 1
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert rows[0]["issue_number"] == "1"
+    assert json.loads(rows[0]["suggested_labels"]) == ["enhancement"]
+
+    out = io.StringIO()
+    assert store.export(out, fmt="jsonl") == 2
+    assert [json.loads(line)["repository"] for line in out.getvalue().splitlines()] == ["o/r", "x/y"]
+
+
+def test_export_rejects_unknown_format(store):
+    with pytest.raises(ValueError):
+        store.export(io.StringIO(), fmt="xml")
@@ -0,0 +1,95 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from github.Issue import Issue
+
+import github_utils
+from github_utils import IssueRecord, iter_pages
+
+PAGE_SIZE = 3
+
+
+class FakePaginatedList:
+    def __init__(self, count, delay=0.0):
+        self.items = list(range(count))
+        self.delay = delay
+        self.requested = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def get_page(self, page):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        self.requested.append(page)
+        with self.lock:
+            self.active -= 1
+        return self.items[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+
+
+class FailingPaginatedList:
+    def get_page(self, page):
+        raise ValueError("rate limited")
+
+
+class OfflineRequester:
+    is_not_lazy = False
+
+    def __getattr__(self, name):
+        raise AssertionError(f"unexpected request: {name}")
+
+
+@pytest.fixture(autouse=True)
+def page_size(monkeypatch):
+    monkeypatch.setattr(github_utils, "get_transport_config", lambda: SimpleNamespace(page_size=PAGE_SIZE))
+
+
+@pytest.mark.parametrize("count, pages", [(0, [0]), (2, [0]), (3, [0, 1]), (7, [0, 1, 2])])
+def test_iter_pages_stops_at_first_short_page(count, pages):
+    listing = FakePaginatedList(count)
+    assert list(iter_pages(listing)) == list(range(count))
+    assert listing.requested == pages
+
+
+def test_iter_pages_propagates_fetch_errors():
+    with pytest.raises(ValueError, match="rate limited"):
+        list(iter_pages(FailingPaginatedList()))
+
+
+def test_iter_pages_waits_for_in_flight_fetch_when_closed_early():
+    listing = FakePaginatedList(30, delay=0.05)
+    pages = iter_pages(listing)
+    assert next(pages) == 0
+    pages.close()
+    fetched = list(listing.requested)
+    time.sleep(0.15)
+    assert listing.requested == fetched
+    assert listing.active == 0
+    assert len(fetched) <= 3
+
+
+def test_issue_record_is_built_from_listing_payload_without_requests():
+    issue = Issue(
+        OfflineRequester(),
+        {},
+        {
+            "number": 3,
+            "title": "Title",
+            "body": None,
+            "labels": [{"name": "bug", "url": "https://api.github.com/repos/o/r/labels/bug"}],
+            "updated_at": "2026-10-19T00:00:00Z",
+            "comments": 2,
+            "html_url": "https://github.com/o/r/issues/3",
+            "url": "https://api.github.com/repos/o/r/issues/3",
+        },
+    )
+
+    record = IssueRecord.from_issue(issue)
+
+    assert (record.number, record.title, record.body, record.labels, record.comments) == (3, "Title", "", ["bug"], 2)
+    assert "/pull/" not in issue.html_url
+    assert not hasattr(record, "__dict__")
@@ -0,0 +1,54 @@
+import pytest
+
+from github_utils import LabelIndex
+from prompts import build_user_story_eval_prompt
+
+REPOSITORY_LABELS = ["Bug", "good first issue", "feature/api", "docs", "priority: p1", "size: L", "area-api"]
+
+
+@pytest.fixture
+def index():
+    return LabelIndex(REPOSITORY_LABELS)
+
+
+@pytest.mark.parametrize("suggested, expected", [
+    ("bug", "Bug"),
+    ("BUG", "Bug"),
+    ("bugs", "Bug"),
+    ("Good-First-Issue", "good first issue"),
+    ("good_first_issue", "good first issue"),
+    ("feature / api", "feature/api"),
+    ("doc", "docs"),
+    ("Priority:P1", "priority: p1"),
+])
+def test_resolve_tolerates_case_separator_and_plural_variants(index, suggested, expected):
+    assert index.resolve(suggested) == expected
+
+
+@pytest.mark.parametrize("suggested", ["priority: p2", "size: XL", "area: api", "enhancement", ""])
+def test_resolve_does_not_match_distinct_labels(index, suggested):
+    assert index.resolve(suggested) is None
+
+
+def test_reserved_labels_are_excluded():
+    index = LabelIndex(["bug", "vtpm-review", "VTPM-Ignore"])
+
+    assert index.names == ["bug"]
+    assert index.resolve("vtpm-review") is None
+    assert index.normalize(["vtpm-review", "bug", "vtpm-ignore"]) == ["bug"]
+
+
+def test_normalize_deduplicates_and_drops_unknown_labels(index, capsys):
+    assert index.normalize(["bugs", "Bug", "enhancement", "docs"]) == ["Bug", "docs"]
+    assert "enhancement" in capsys.readouterr().out
+
+
+def test_prompt_lists_allowed_labels():
+    content = build_user_story_eval_prompt("Title", "Body", ["Bug", "docs"])[-1]["content"]
+    assert "Bug, docs" in content
+
+
+def test_prompt_asks_for_no_labels_when_repository_has_none():
+    content = build_user_story_eval_prompt("Title", "Body", [])[-1]["content"]
+    assert "Leave the Labels field empty" in content
+    assert LabelIndex([]).normalize(["bug"]) == []
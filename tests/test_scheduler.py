@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from github_utils import IssueRecord
+from scheduler import BudgetScheduler, estimate_prompt_tokens, issue_priority
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+def make_issue(number, labels=None, updated_at=NOW, body="body", comments=0):
+    return IssueRecord(number, f"Issue {number}", body, labels or [], updated_at, comments)
+
+
+def test_estimate_prompt_tokens_rounds_up_and_counts_message_overhead():
+    messages = [{"role": "system", "content": "abcd"}, {"role": "user", "content": "abcde"}]
+    assert estimate_prompt_tokens(messages) == (4 + 1) + (4 + 2)
+
+
+def test_review_label_sorts_before_recency():
+    older_review = make_issue(1, labels=["VTPM-Review"], updated_at=NOW - timedelta(days=10))
+    newer = make_issue(2)
+    assert issue_priority(older_review, True) < issue_priority(newer, False)
+
+
+def test_recency_is_bucketed_so_unevaluated_issues_win_within_a_day():
+    evaluated = make_issue(1, updated_at=NOW)
+    unevaluated = make_issue(2, updated_at=NOW - timedelta(hours=2))
+    assert issue_priority(unevaluated, False) < issue_priority(evaluated, True)
+    assert issue_priority(make_issue(3, updated_at=NOW), True) < issue_priority(
+        make_issue(4, updated_at=NOW - timedelta(days=2)), False
+    )
+
+
+def test_plan_orders_by_priority_and_keeps_input_order_for_ties():
+    issues = [
+        make_issue(1, updated_at=NOW - timedelta(days=3)),
+        make_issue(2, comments=1),
+        make_issue(3),
+        make_issue(4, labels=["vtpm-review"], updated_at=NOW - timedelta(days=5)),
+        make_issue(5),
+    ]
+    queue = BudgetScheduler().plan(issues, has_prior_evaluation=lambda issue: issue.comments > 0)
+    assert [item.issue.number for item in queue] == [4, 3, 5, 2, 1]
+
+
+def test_estimate_releases_the_issue_body():
+    issue = make_issue(1, body="x" * 400)
+    item = BudgetScheduler(completion_token_reserve=0).estimate(issue)
+    assert item.estimated_tokens > 100
+    assert issue.body is None
+
+
+def test_run_stops_at_token_ceiling_and_defers_the_rest():
+    issues = [make_issue(n) for n in range(1, 5)]
+    scheduler = BudgetScheduler(max_tokens=3000)
+    processed = []
+
+    def process(issue):
+        processed.append(issue.number)
+        return {"prompt_tokens": 1000, "completion_tokens": 200}
+
+    report = scheduler.run(issues, process, has_prior_evaluation=lambda issue: False)
+
+    assert processed == [1, 2]
+    assert report.tokens_used == 2400
+    assert [item.issue.number for item in report.deferred] == [3, 4]
+    assert report.budget_exhausted
+
+
+def test_run_charges_cost_from_reported_usage():
+    scheduler = BudgetScheduler(max_cost=1.0, cost_per_1k_tokens=0.5)
+    report = scheduler.run(
+        [make_issue(1)],
+        lambda issue: {"prompt_tokens": 1500, "completion_tokens": 500},
+        has_prior_evaluation=lambda issue: False,
+    )
+    assert report.cost_used == pytest.approx(1.0)
+
+
+def test_run_falls_back_to_estimate_when_usage_is_not_reported():
+    scheduler = BudgetScheduler()
+    report = scheduler.run([make_issue(1)], lambda issue: None, has_prior_evaluation=lambda issue: False)
+    assert report.tokens_used == report.processed[0].estimated_tokens
+
+
+def test_run_records_failures_and_continues():
+    def process(issue):
+        if issue.number == 1:
+            raise RuntimeError("boom")
+        return {"prompt_tokens": 10, "completion_tokens": 5}
+
+    report = BudgetScheduler().run(
+        [make_issue(1), make_issue(2)], process, has_prior_evaluation=lambda issue: False
+    )
+
+    assert [item.issue.number for item, _ in report.failed] == [1]
+    assert "RuntimeError: boom" in report.failed[0][1]
+    assert [item.issue.number for item in report.processed] == [2]
+    assert report.tokens_used == report.failed[0][0].estimated_tokens + 15
+    assert not report.budget_exhausted
+    assert "#1 Issue 1: RuntimeError: boom" in report.to_text()
+
+
+def test_run_skips_issues_that_do_not_need_evaluation():
+    processed = []
+    report = BudgetScheduler().run(
+        [make_issue(1), make_issue(2)],
+        lambda issue: processed.append(issue.number),
+        has_prior_evaluation=lambda issue: False,
+        needs_evaluation=lambda issue: issue.number != 1,
+    )
+    assert report.skipped == [1]
+    assert processed == [2]